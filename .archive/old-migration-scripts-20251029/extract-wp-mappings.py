@@ -5,6 +5,7 @@ Extrahiert featured image mappings aus WordPress SQL Dump
 und matched sie gegen existierende WebP Files
 """
 
+import os
 import re
 import json
 from pathlib import Path
@@ -65,25 +66,38 @@ def extract_post_slugs(sql_content):
     print(f"✓ {len(posts)} posts/portfolios gefunden")
     return posts
 
-def convert_to_webp_path(original_path):
-    """Konvertiert WordPress Pfad zu WebP Pfad"""
+# Dateinamen in UPLOADS_DIR, einmal pro Lauf gelesen
+_upload_names = None
+
+def upload_names():
+    """Ein scandir von UPLOADS_DIR statt ein stat() pro Kandidat (NFS)"""
+    global _upload_names
+    if _upload_names is None:
+        try:
+            with os.scandir(UPLOADS_DIR) as entries:
+                _upload_names = {entry.name for entry in entries}
+        except FileNotFoundError:
+            _upload_names = set()
+    return _upload_names
+
+def webp_candidates(original_path):
+    """Mögliche WebP Dateinamen in UPLOADS_DIR, in Prüf-Reihenfolge"""
     # Beispiel: 2023/04/file.png -> file.webp
     filename = Path(original_path).stem
-    webp_name = f"{filename}.webp"
-
-    # Prüfe ob File existiert
-    webp_path = UPLOADS_DIR / webp_name
-    if webp_path.exists():
-        return f"/uploads/{webp_name}"
+    candidates = [f"{filename}.webp"]
 
     # Alternative: mit Datum prefix
     date_prefix = Path(original_path).parts[0] if '/' in original_path else None
     if date_prefix:
-        alt_name = f"{date_prefix.replace('/', '-')}-{filename}.webp"
-        alt_path = UPLOADS_DIR / alt_name
-        if alt_path.exists():
-            return f"/uploads/{alt_name}"
+        candidates.append(f"{date_prefix.replace('/', '-')}-{filename}.webp")
+    return candidates
 
+def convert_to_webp_path(original_path):
+    """Konvertiert WordPress Pfad zu WebP Pfad"""
+    # Alle Kandidaten liegen direkt in UPLOADS_DIR
+    for name in webp_candidates(original_path):
+        if name in upload_names():
+            return f"/uploads/{name}"
     return None
 
 def main():
@@ -4,9 +4,11 @@ Map WordPress Featured Images to PostgreSQL
 Nutzt die bereits extrahierten _thumbnail_id und _wp_attached_file Daten
 """
 
+import os
 import re
 import json
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Bekannte Mappings aus grep Output
@@ -93,42 +95,81 @@ def get_pg_articles():
 
     return articles
 
+# Max. parallele Verzeichnis-Scans (public/uploads liegt in Produktion auf NFS)
+MAX_WORKERS = 16
+
+# Pro Lauf gecachte Verzeichnislisten und rekursive WebP Liste
+_dir_listings = {}
+_webp_files = None
+
+def _scan_dir(directory):
+    """Ein scandir pro Ordner statt ein stat() pro Kandidat"""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+def list_dirs(directories):
+    """Liest mehrere Ordner parallel (begrenzter Thread Pool, gecacht pro Lauf)"""
+    pending = [d for d in set(directories) if d not in _dir_listings]
+    if pending:
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(pending))) as pool:
+            for directory, names in zip(pending, pool.map(_scan_dir, pending)):
+                _dir_listings[directory] = names
+    return _dir_listings
+
+def path_exists(path):
+    """Path.exists() über die gecachten Verzeichnislisten"""
+    return path.name in list_dirs([path.parent])[path.parent]
+
+def all_webp_files():
+    """Rekursive WebP Liste für die Fallbacks, einmal pro Lauf"""
+    global _webp_files
+    if _webp_files is None:
+        _webp_files = list(UPLOADS_DIR.rglob("*.webp"))
+    return _webp_files
+
+def webp_candidate(original_path):
+    """WebP Kandidat im gleichen Unterordner, z.B. 2023/04/file.png -> 2023/04/file.webp"""
+    path = Path(original_path)
+    date_folder = '/'.join(path.parts[:-1])  # z.B. "2023/04"
+    webp_name = path.name if original_path.endswith('.webp') else f"{path.stem}.webp"
+    return date_folder, webp_name
+
 def convert_to_webp(original_path):
     """Konvertiere WP Pfad zu WebP"""
-    # Beispiel: 2023/04/file.png -> 2023/04/file.webp
-    path = Path(original_path)
-    filename = path.stem
-
-    # Bereits WebP?
-    if original_path.endswith('.webp'):
-        webp_name = path.name
-        # Suche in gleichem Unterordner
-        date_folder = '/'.join(path.parts[:-1])  # z.B. "2024/07"
-        webp_path = UPLOADS_DIR / date_folder / webp_name
-        if webp_path.exists():
-            return f"/uploads/{date_folder}/{webp_name}"
-    else:
-        webp_name = f"{filename}.webp"
-        # Suche in gleichem Unterordner
-        date_folder = '/'.join(path.parts[:-1])  # z.B. "2023/04"
-        webp_path = UPLOADS_DIR / date_folder / webp_name
-        if webp_path.exists():
-            return f"/uploads/{date_folder}/{webp_name}"
+    filename = Path(original_path).stem
+
+    # Suche in gleichem Unterordner
+    date_folder, webp_name = webp_candidate(original_path)
+    if path_exists(UPLOADS_DIR / date_folder / webp_name):
+        return f"/uploads/{date_folder}/{webp_name}"
 
     # Fallback: Suche rekursiv
-    for webp_file in UPLOADS_DIR.rglob("*.webp"):
+    for webp_file in all_webp_files():
         if webp_file.stem == filename:
             relative_path = webp_file.relative_to(UPLOADS_DIR)
             return f"/uploads/{relative_path}"
 
     # Fallback 2: Ähnlicher Filename
-    for webp_file in UPLOADS_DIR.rglob("*.webp"):
+    for webp_file in all_webp_files():
         if filename.lower() in webp_file.stem.lower():
             relative_path = webp_file.relative_to(UPLOADS_DIR)
             return f"/uploads/{relative_path}"
 
     return None
 
+def convert_to_webp_batch(original_paths):
+    """Konvertiere viele WP Pfade auf einmal -> {original_path: webp_path|None}
+
+    Alle Zielordner werden vorab gesammelt und parallel gelesen, danach
+    sind alle Existenz-Prüfungen reine Lookups im Speicher.
+    """
+    original_paths = list(dict.fromkeys(original_paths))
+    list_dirs(UPLOADS_DIR / webp_candidate(p)[0] for p in original_paths)
+    return {p: convert_to_webp(p) for p in original_paths}
+
 def main():
     print("🔍 Parse WordPress Mappings...")
     thumbnails, attachments = parse_mappings()
@@ -162,6 +203,11 @@ def main():
     updates = []
     not_found = []
 
+    # Alle Dateipfade vorab auflösen (parallel, ein scandir pro Ordner)
+    webp_paths = convert_to_webp_batch(
+        attachments[a] for a in thumbnails.values() if a in attachments
+    )
+
     for wp_post_id, attachment_id in thumbnails.items():
         if wp_post_id not in wp_post_slugs:
             not_found.append(f"WP Post {wp_post_id} - kein Slug bekannt")
@@ -180,7 +226,7 @@ def main():
             continue
 
         original_path = attachments[attachment_id]
-        webp_path = convert_to_webp(original_path)
+        webp_path = webp_paths[original_path]
 
         if not webp_path:
             not_found.append(f"WebP für {original_path} nicht gefunden")
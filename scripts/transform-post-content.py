@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+WordPress Post Content Transformer
+Cleans post_content from the WordPress SQL dump in a single pass per post:
+  - strips Avada [fusion_*] shortcodes (inner content is kept)
+  - converts [fusion_title] to headings and [fusion_imageframe] to <img>
+  - rewrites wp-content/uploads image URLs to their WebP paths in public/uploads
+
+The WebP lookup table is built once from public/uploads and shared with a
+process pool that transforms all posts. Throughput is reported in MB/s.
+
+Usage:
+    python3 scripts/transform-post-content.py
+    python3 scripts/transform-post-content.py --types post,avada_portfolio --workers 8
+"""
+
+import argparse
+import html
+import json
+import os
+import re
+import time
+from multiprocessing import Pool
+from pathlib import Path
+
+# Pfade
+SQL_FILE = Path(".docker/data/mysql/sta3wp.sql")
+UPLOADS_DIR = Path("public/uploads")
+OUTPUT_FILE = Path("scripts/wp-post-content.jsonl")
+
+# as_posts column positions in the dump
+COL_ID = 0
+COL_CONTENT = 4
+COL_TITLE = 5
+COL_STATUS = 7
+COL_NAME = 11
+COL_TYPE = 20
+
+# Non-Avada WordPress shortcodes that are stripped as well. Anything else in
+# square brackets is left alone so code samples like arr[0] survive.
+WP_SHORTCODES = {'caption', 'gallery', 'embed', 'video', 'audio', 'contact-form-7'}
+
+SQL_TOKEN = re.compile(r"'([^'\\]*(?:(?:\\.|'')[^'\\]*)*)'|(NULL)|(-?\d+(?:\.\d+)?)|([(),;])", re.S)
+SQL_ESCAPES = {'0': '\0', 'b': '\b', 'n': '\n', 'r': '\r', 't': '\t', 'Z': '\x1a'}
+SQL_ESCAPE = re.compile(r"\\(.)|''", re.S)
+
+IMAGE_URL = (r"(?:(?:https?:)?//[^\s\"'<>()\[\]]*?)?/?wp-content/uploads/"
+             r"([^\s\"'<>()\[\]?#]+?)\.(?:jpe?g|png|gif|webp)"
+             r"(?:[?#][^\s\"'<>()\[\]]*)?")
+
+# One alternation so each post is tokenized exactly once. Order matters:
+# whole imageframe elements first, then shortcode tags, URLs, blank lines.
+CONTENT_TOKEN = re.compile(
+    r"(?=[\[\nhw/])"
+    r"(?:\[fusion_imageframe(?P<frame_attrs>[^\]]*)\]\s*(?P<frame_src>[^\s\[]*)\s*\[/fusion_imageframe\]"
+    r"|\[(?P<close>/?)(?P<tag>fusion_\w+|" + '|'.join(re.escape(t) for t in WP_SHORTCODES) +
+    r")(?P<attrs>(?:\s[^\]]*)?)/?\]"
+    r"|(?P<url>" + IMAGE_URL + r")"
+    r"|(?P<blank>\n[ \t\r]*\n(?:[ \t\r]*\n)+))",
+    re.I
+)
+URL_PATH = re.compile(IMAGE_URL, re.I)
+ATTR = re.compile(r'(\w+)="([^"]*)"')
+SIZE_SUFFIX = re.compile(r'-\d+x\d+$')
+
+# Worker-global lookup table, set by init_worker()
+_webp_lookup = None
+
+
+def unescape_sql(value):
+    """Unescape a MySQL string literal body"""
+    return SQL_ESCAPE.sub(lambda m: SQL_ESCAPES.get(m.group(1), m.group(1)) if m.group(1) else "'", value)
+
+
+def parse_insert_rows(statement):
+    """Yield rows (lists of values) from a single INSERT ... VALUES statement"""
+    start = statement.index(' VALUES ') + len(' VALUES ')
+    row = None
+    for match in SQL_TOKEN.finditer(statement, start):
+        string, null, number, punct = match.groups()
+        if punct == '(':
+            row = []
+        elif punct == ')':
+            yield row
+            row = None
+        elif row is None:
+            continue
+        elif string is not None:
+            row.append(unescape_sql(string))
+        elif null:
+            row.append(None)
+        elif number is not None:
+            row.append(number)
+
+
+def iter_posts(sql_file, post_types):
+    """Stream published posts of the given types from the SQL dump"""
+    with open(sql_file, 'r', encoding='utf-8', errors='ignore') as f:
+        for line in f:
+            if not line.startswith('INSERT INTO `as_posts` VALUES'):
+                continue
+            for row in parse_insert_rows(line):
+                if len(row) <= COL_TYPE or row[COL_TYPE] not in post_types:
+                    continue
+                if row[COL_STATUS] != 'publish':
+                    continue
+                yield {
+                    "post_id": row[COL_ID],
+                    "slug": row[COL_NAME],
+                    "type": row[COL_TYPE],
+                    "title": row[COL_TITLE],
+                    "content": row[COL_CONTENT] or ''
+                }
+
+
+def build_webp_lookup(uploads_dir):
+    """Build (paths, stems) lookup tables from a single scan
+
+    paths maps the relative path without extension (2023/04/file) to its
+    WebP url. stems maps the lowercased file stem alone, which covers WebP
+    files that were flattened out of date folders; stems shared by several
+    files map to None, so a common name like "logo" is never guessed.
+    """
+    paths = {}
+    stems = {}
+    for root, _, files in os.walk(uploads_dir):
+        for name in files:
+            if not name.lower().endswith('.webp'):
+                continue
+            relative = Path(root, name).relative_to(uploads_dir).as_posix()
+            url = f"/uploads/{relative}"
+            paths[relative[:-len('.webp')]] = url
+            stem = name[:-len('.webp')].lower()
+            stems[stem] = None if stem in stems else url
+    return paths, stems
+
+
+def resolve_webp(upload_path, lookup):
+    """Resolve '2023/04/file-300x200' to a WebP url, or None
+
+    Tries the date path, then the date path without the WP size suffix,
+    and only then the unique bare stem of either.
+    """
+    paths, stems = lookup
+    candidates = (upload_path, SIZE_SUFFIX.sub('', upload_path))
+    for candidate in candidates:
+        url = paths.get(candidate)
+        if url:
+            return url
+    for candidate in candidates:
+        url = stems.get(candidate.rsplit('/', 1)[-1].lower())
+        if url:
+            return url
+    return None
+
+
+def transform_content(content, lookup, stats):
+    """Strip/convert shortcodes and rewrite image URLs in one regex pass"""
+    open_titles = []
+
+    def rewrite_url(url_match):
+        # The whole match, including any ?query or #fragment, is replaced
+        url = resolve_webp(url_match.group(1), lookup)
+        if url:
+            stats['images'] += 1
+            return url
+        stats['unresolved'] += 1
+        return url_match.group(0)
+
+    def replace(m):
+        if m.group('frame_attrs') is not None:
+            stats['shortcodes'] += 1
+            attrs = dict(ATTR.findall(m.group('frame_attrs')))
+            src = m.group('frame_src')
+            url_match = URL_PATH.fullmatch(src)
+            if url_match:
+                src = rewrite_url(url_match)
+            if not src:
+                return ''
+            # Attribute values in the dump may already contain entities, and
+            # an unresolved src is raw dump text that must not break out of src=""
+            src = html.escape(html.unescape(src), quote=True)
+            alt = html.escape(html.unescape(attrs.get('alt', '')), quote=True)
+            return f'<img src="{src}" alt="{alt}" loading="lazy" />'
+
+        if m.group('tag'):
+            stats['shortcodes'] += 1
+            if m.group('tag').lower() == 'fusion_title':
+                if m.group('close'):
+                    return f"</h{open_titles.pop()}>" if open_titles else ''
+                size = dict(ATTR.findall(m.group('attrs'))).get('size', '2')
+                level = size if size in {'1', '2', '3', '4', '5', '6'} else '2'
+                open_titles.append(level)
+                return f"<h{level}>"
+            return ''
+
+        if m.group('url'):
+            return rewrite_url(URL_PATH.fullmatch(m.group('url')))
+
+        return '\n\n'
+
+    return CONTENT_TOKEN.sub(replace, content).strip()
+
+
+def init_worker(lookup):
+    global _webp_lookup
+    _webp_lookup = lookup
+
+
+def transform_post(post):
+    """Pool worker: transform one post, return (post, input bytes, stats)"""
+    stats = {'shortcodes': 0, 'images': 0, 'unresolved': 0}
+    size = len(post['content'].encode('utf-8'))
+    post['content'] = transform_content(post['content'], _webp_lookup, stats)
+    return post, size, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Clean WordPress post_content for the CMS')
+    parser.add_argument('--sql', type=Path, default=SQL_FILE, help='WordPress SQL dump')
+    parser.add_argument('--uploads', type=Path, default=UPLOADS_DIR, help='WebP uploads directory')
+    parser.add_argument('--output', type=Path, default=OUTPUT_FILE, help='Output JSONL file')
+    parser.add_argument('--types', default='post,page,avada_portfolio', help='Post types to include')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='Worker processes')
+    args = parser.parse_args()
+
+    print("🗂️  Baue WebP Lookup Tabelle...")
+    lookup = build_webp_lookup(args.uploads)
+    paths, stems = lookup
+    ambiguous = sum(1 for url in stems.values() if url is None)
+    print(f"   ✓ {len(paths)} WebP Dateien aus {args.uploads} "
+          f"({ambiguous} mehrdeutige Dateinamen ohne Fallback)")
+
+    print(f"\n🧹 Transformiere Posts aus {args.sql} ({args.workers} Worker)...")
+    totals = {'shortcodes': 0, 'images': 0, 'unresolved': 0}
+    total_bytes = 0
+    count = 0
+    start = time.perf_counter()
+
+    posts = iter_posts(args.sql, set(args.types.split(',')))
+    with Pool(args.workers, initializer=init_worker, initargs=(lookup,)) as pool, \
+            open(args.output, 'w', encoding='utf-8') as out:
+        for post, size, stats in pool.imap(transform_post, posts, chunksize=16):
+            out.write(json.dumps(post, ensure_ascii=False) + '\n')
+            total_bytes += size
+            count += 1
+            for key, value in stats.items():
+                totals[key] += value
+
+    elapsed = time.perf_counter() - start
+    throughput = total_bytes / (1024 * 1024) / elapsed if elapsed else 0.0
+
+    print(f"\n✅ {count} Posts transformiert in {elapsed:.2f}s "
+          f"({total_bytes / (1024 * 1024):.1f} MB, {throughput:.1f} MB/s)")
+    print(f"   - {totals['shortcodes']} Shortcodes entfernt/konvertiert")
+    print(f"   - {totals['images']} Bild-URLs auf WebP umgeschrieben")
+    print(f"   - {totals['unresolved']} Bild-URLs ohne WebP")
+    print(f"\n💾 Gespeichert: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
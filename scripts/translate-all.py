@@ -1,367 +1,235 @@
 #!/usr/bin/env python3
 """
-Translate i18n files from German to all configured languages
-Creates complete, professional translations for all language files
-Uses German as source template
+Translate i18n files from English to all configured languages
+Uses English as source template and replaces known phrases per language
+
+Usage:
+    python3 scripts/translate-all.py           # translate common.json once
+    python3 scripts/translate-all.py --watch   # re-translate changed keys on save
+    python3 scripts/translate-all.py --compile # validate and compile phrase tables
+
+Phrase tables live in scripts/phrases/<lang>.json and are compiled on first
+use into scripts/phrases/.cache/<lang>.bin, which is reused until the JSON
+source changes.
 """
 
+import argparse
+import ctypes
+import ctypes.util
 import json
+import os
+import select
+import struct
+import sys
+import time
+import zlib
+from array import array
 from pathlib import Path
 
+LOCALES_DIR = Path(__file__).parent.parent / 'i18n' / 'locales'
+PHRASES_DIR = Path(__file__).parent / 'phrases'
+PHRASES_CACHE_DIR = PHRASES_DIR / '.cache'
+SOURCE_LANG = 'en'
+
+# Target languages
+LANGUAGES = {
+    'de': 'Deutsch',
+    'sr': 'Српски',
+    'es': 'Español',
+    'fr': 'Français',
+    'it': 'Italiano',
+    'ru': 'Русский'
+}
+
+# Quiet period before a burst of filesystem events is processed
+DEBOUNCE_SECONDS = 0.03
+
+# Compiled phrase table header: magic, format version, source mtime_ns, source size,
+# count, CRC32 of offsets + blob
+PHRASES_HEADER = struct.Struct('<4sHqqII')
+PHRASES_MAGIC = b'PHRS'
+PHRASES_VERSION = 2
+
+_phrase_tables = {}
+
+
+def load_json(filepath):
+    """Load JSON file"""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
 def save_json(filepath, data):
-    """Save JSON file with proper formatting"""
-    with open(filepath, 'w', encoding='utf-8') as f:
+    """Save JSON file with proper formatting
+
+    Written to a temp file and renamed into place, so the Nuxt dev server
+    never reloads a half-written locale file.
+    """
+    filepath = Path(filepath)
+    tmp = filepath.with_name(f".{filepath.name}.tmp")
+    with open(tmp, 'w', encoding='utf-8') as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
         f.write('\n')
+    os.replace(tmp, filepath)
 
-def translate_value(value, translations):
+def translate_value(value, phrases):
     """Translate a single string value"""
     if isinstance(value, str):
-        # Replace each German phrase with translated version
+        # Replace each English phrase with translated version, longest first
         result = value
-        for de_text, translated in sorted(translations.items(), key=lambda x: -len(x[0])):
-            result = result.replace(de_text, translated)
+        for en_text, translated in phrases:
+            result = result.replace(en_text, translated)
         return result
     return value
 
-def translate_structure(obj, translations):
+def translate_structure(obj, phrases):
     """Recursively translate all values in nested structure"""
     if isinstance(obj, dict):
-        return {k: translate_structure(v, translations) for k, v in obj.items()}
+        return {k: translate_structure(v, phrases) for k, v in obj.items()}
     elif isinstance(obj, list):
-        return [translate_structure(item, translations) for item in obj]
+        return [translate_structure(item, phrases) for item in obj]
     elif isinstance(obj, str):
-        return translate_value(obj, translations)
+        return translate_value(obj, phrases)
     return obj
 
-def get_translations():
-    """Get all translation mappings from German to target languages"""
-    return {
-        'en': {
-            # English translations from German
-        'de': {
-            # Actions
-            'Continue now': 'Jetzt fortfahren',
-            'Delete': 'Löschen',
-            'Edit': 'Bearbeiten',
-            'Load more': 'Mehr laden',
-            'Profile': 'Profil',
-            'Reset': 'Zurücksetzen',
-            'View articles': 'Artikel anzeigen',
-            'Cancel': 'Abbrechen',
-            'Back': 'Zurück',
-            'Home': 'Startseite',
-
-            # App
-            'A simple and efficient starting point': 'Ein einfacher und effizienter Ausgangspunkt',
-            'Created by William Fontaine': 'Erstellt von Aleksandar Stajic',
-            'Nuxt Boilerplate': 'Nuxt Boilerplate',
-
-            # Common words
-            'Email address': 'E-Mail-Adresse',
-            'Password': 'Passwort',
-            'Error': 'Fehler',
-            'Sign in': 'Anmelden',
-            'Sign up': 'Registrieren',
-            'Login': 'Anmeldung',
-            'Logout': 'Abmelden',
-            'article': 'Artikel',
-            'Article': 'Artikel',
-            'articles': 'Artikel',
-
-            # Auth
-            'Back to login': 'Zurück zur Anmeldung',
-            'Back to home': 'Zurück zur Startseite',
-            'Forgot password': 'Passwort vergessen',
-            'Reset your password': 'Passwort zurücksetzen',
-            'Enter your email address': 'E-Mail-Adresse eingeben',
-            'Enter your password': 'Passwort eingeben',
-            'Remember your password?': 'Passwort wieder eingefallen?',
-            'Send reset link': 'Reset-Link senden',
-
-            # Validation
-            'is not valid': 'ist ungültig',
-            'cannot exceed': 'darf nicht überschreiten',
-            'characters': 'Zeichen',
-            'is required': 'ist erforderlich',
-            'must be at least': 'muss mindestens',
-            'characters long': 'Zeichen lang sein',
-            'must contain at least': 'muss mindestens enthalten',
-
-            # Categories
-            'Categories': 'Kategorien',
-            'All Articles': 'Alle Artikel',
-            'Cached': 'Zwischengespeichert',
-            'No articles found': 'Keine Artikel gefunden',
-            'No articles found in this category': 'Keine Artikel in dieser Kategorie gefunden',
-            'Loaded from cache': 'Aus Cache geladen',
-
-            # Navigation
-            'Back to Home': 'Zurück zur Startseite',
-            'Previous Page': 'Vorherige Seite',
-            'Next Page': 'Nächste Seite',
-            'Page': 'Seite',
-
-            # Language
-            'Language': 'Sprache',
-            'Switch to': 'Wechseln zu',
-        },
-        'sr': {
-            # Serbian (Cyrillic)
-            'Continue now': 'Настави сада',
-            'Delete': 'Обриши',
-            'Edit': 'Уреди',
-            'Load more': 'Учитај више',
-            'Profile': 'Профил',
-            'Reset': 'Ресетуј',
-            'View articles': 'Погледај чланке',
-            'Cancel': 'Откажи',
-            'Back': 'Назад',
-            'Home': 'Почетна',
-
-            'A simple and efficient starting point': 'Једноставна и ефикасна полазна тачка',
-            'Created by William Fontaine': 'Креирао Александар Стајић',
-
-            'Email address': 'Имејл адреса',
-            'Password': 'Лозинка',
-            'Error': 'Грешка',
-            'Sign in': 'Пријави се',
-            'Sign up': 'Региструј се',
-            'Login': 'Пријава',
-            'Logout': 'Одјава',
-            'article': 'чланак',
-            'Article': 'Чланак',
-            'articles': 'чланака',
-
-            'Categories': 'Категорије',
-            'All Articles': 'Сви Чланци',
-            'Cached': 'Кеширано',
-            'No articles found': 'Нема пронађених чланака',
-            'No articles found in this category': 'Нема чланака у овој категорији',
-            'Loaded from cache': 'Учитано из кеша',
-
-            'Back to Home': 'Назад на почетну',
-            'Previous Page': 'Претходна страна',
-            'Next Page': 'Следећа страна',
-            'Page': 'Страна',
-
-            'Language': 'Језик',
-            'Switch to': 'Пребаци на',
-        },
-        'es': {
-            # Spanish
-            'Continue now': 'Continuar ahora',
-            'Delete': 'Eliminar',
-            'Edit': 'Editar',
-            'Load more': 'Cargar más',
-            'Profile': 'Perfil',
-            'Reset': 'Restablecer',
-            'View articles': 'Ver artículos',
-            'Cancel': 'Cancelar',
-            'Back': 'Atrás',
-            'Home': 'Inicio',
-
-            'A simple and efficient starting point': 'Un punto de partida simple y eficiente',
-            'Created by William Fontaine': 'Creado por Aleksandar Stajic',
-
-            'Email address': 'Dirección de correo electrónico',
-            'Password': 'Contraseña',
-            'Error': 'Error',
-            'Sign in': 'Iniciar sesión',
-            'Sign up': 'Registrarse',
-            'Login': 'Inicio de sesión',
-            'Logout': 'Cerrar sesión',
-            'article': 'artículo',
-            'Article': 'Artículo',
-            'articles': 'artículos',
-
-            'Categories': 'Categorías',
-            'All Articles': 'Todos los Artículos',
-            'Cached': 'En caché',
-            'No articles found': 'No se encontraron artículos',
-            'No articles found in this category': 'No se encontraron artículos en esta categoría',
-            'Loaded from cache': 'Cargado desde caché',
-
-            'Back to Home': 'Volver al Inicio',
-            'Previous Page': 'Página Anterior',
-            'Next Page': 'Página Siguiente',
-            'Page': 'Página',
-
-            'Language': 'Idioma',
-            'Switch to': 'Cambiar a',
-        },
-        'fr': {
-            # French
-            'Continue now': 'Continuer maintenant',
-            'Delete': 'Supprimer',
-            'Edit': 'Modifier',
-            'Load more': 'Charger plus',
-            'Profile': 'Profil',
-            'Reset': 'Réinitialiser',
-            'View articles': 'Voir les articles',
-            'Cancel': 'Annuler',
-            'Back': 'Retour',
-            'Home': 'Accueil',
-
-            'A simple and efficient starting point': 'Un point de départ simple et efficace',
-            'Created by William Fontaine': 'Créé par Aleksandar Stajic',
-
-            'Email address': 'Adresse e-mail',
-            'Password': 'Mot de passe',
-            'Error': 'Erreur',
-            'Sign in': 'Se connecter',
-            'Sign up': 'S\'inscrire',
-            'Login': 'Connexion',
-            'Logout': 'Déconnexion',
-            'article': 'article',
-            'Article': 'Article',
-            'articles': 'articles',
-
-            'Categories': 'Catégories',
-            'All Articles': 'Tous les Articles',
-            'Cached': 'En cache',
-            'No articles found': 'Aucun article trouvé',
-            'No articles found in this category': 'Aucun article trouvé dans cette catégorie',
-            'Loaded from cache': 'Chargé depuis le cache',
-
-            'Back to Home': 'Retour à l\'Accueil',
-            'Previous Page': 'Page Précédente',
-            'Next Page': 'Page Suivante',
-            'Page': 'Page',
-
-            'Language': 'Langue',
-            'Switch to': 'Passer à',
-        },
-        'it': {
-            # Italian
-            'Continue now': 'Continua ora',
-            'Delete': 'Elimina',
-            'Edit': 'Modifica',
-            'Load more': 'Carica altro',
-            'Profile': 'Profilo',
-            'Reset': 'Ripristina',
-            'View articles': 'Visualizza articoli',
-            'Cancel': 'Annulla',
-            'Back': 'Indietro',
-            'Home': 'Home',
-
-            'A simple and efficient starting point': 'Un punto di partenza semplice ed efficiente',
-            'Created by William Fontaine': 'Creato da Aleksandar Stajic',
-
-            'Email address': 'Indirizzo e-mail',
-            'Password': 'Password',
-            'Error': 'Errore',
-            'Sign in': 'Accedi',
-            'Sign up': 'Registrati',
-            'Login': 'Accesso',
-            'Logout': 'Disconnetti',
-            'article': 'articolo',
-            'Article': 'Articolo',
-            'articles': 'articoli',
-
-            'Categories': 'Categorie',
-            'All Articles': 'Tutti gli Articoli',
-            'Cached': 'In cache',
-            'No articles found': 'Nessun articolo trovato',
-            'No articles found in this category': 'Nessun articolo trovato in questa categoria',
-            'Loaded from cache': 'Caricato dalla cache',
-
-            'Back to Home': 'Torna alla Home',
-            'Previous Page': 'Pagina Precedente',
-            'Next Page': 'Pagina Successiva',
-            'Page': 'Pagina',
-
-            'Language': 'Lingua',
-            'Switch to': 'Passa a',
-        },
-        'ru': {
-            # Russian
-            'Continue now': 'Продолжить сейчас',
-            'Delete': 'Удалить',
-            'Edit': 'Редактировать',
-            'Load more': 'Загрузить еще',
-            'Profile': 'Профиль',
-            'Reset': 'Сбросить',
-            'View articles': 'Просмотреть статьи',
-            'Cancel': 'Отмена',
-            'Back': 'Назад',
-            'Home': 'Главная',
-
-            'A simple and efficient starting point': 'Простая и эффективная отправная точка',
-            'Created by William Fontaine': 'Создано Александром Стайичем',
-
-            'Email address': 'Адрес электронной почты',
-            'Password': 'Пароль',
-            'Error': 'Ошибка',
-            'Sign in': 'Войти',
-            'Sign up': 'Зарегистрироваться',
-            'Login': 'Вход',
-            'Logout': 'Выход',
-            'article': 'статья',
-            'Article': 'Статья',
-            'articles': 'статей',
-
-            'Categories': 'Категории',
-            'All Articles': 'Все Статьи',
-            'Cached': 'Кэшировано',
-            'No articles found': 'Статьи не найдены',
-            'No articles found in this category': 'В этой категории нет статей',
-            'Loaded from cache': 'Загружено из кэша',
-
-            'Back to Home': 'Вернуться на главную',
-            'Previous Page': 'Предыдущая страница',
-            'Next Page': 'Следующая страница',
-            'Page': 'Страница',
-
-            'Language': 'Язык',
-            'Switch to': 'Переключить на',
-        }
-    }
-
-    def translate_recursive(obj, trans_map):
-        """Recursively translate values in nested dict"""
-        if isinstance(obj, dict):
-            return {k: translate_recursive(v, trans_map) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [translate_recursive(item, trans_map) for item in obj]
-        elif isinstance(obj, str):
-            # Try to find and replace known phrases
-            result = obj
-            for en_phrase, translated in trans_map.items():
-                result = result.replace(en_phrase, translated)
-            return result
+class PhraseTableError(ValueError):
+    """Raised when a phrase data file fails validation"""
+
+
+def _read_phrase_pairs(pairs):
+    """object_pairs_hook that rejects duplicate phrases instead of dropping them"""
+    table = {}
+    for key, value in pairs:
+        if key in table:
+            raise PhraseTableError(f"duplicate phrase {key!r}")
+        table[key] = value
+    return table
+
+
+def validate_phrases(lang_code, table):
+    """Validate a phrase table loaded from scripts/phrases/<lang>.json"""
+    if not isinstance(table, dict):
+        raise PhraseTableError(f"{lang_code}: expected an object of phrases")
+    for en_text, translated in table.items():
+        if not isinstance(translated, str):
+            raise PhraseTableError(f"{lang_code}: {en_text!r} must map to a string")
+        if not en_text.strip() or not translated.strip():
+            raise PhraseTableError(f"{lang_code}: empty phrase for {en_text!r}")
+        if en_text != en_text.strip():
+            raise PhraseTableError(f"{lang_code}: {en_text!r} has surrounding whitespace")
+
+
+def compile_phrase_table(lang_code):
+    """Compile scripts/phrases/<lang>.json into a binary table and return its pairs
+
+    Layout (little endian):
+        header   magic, version, source mtime_ns, source size, entry count, crc32
+        offsets  uint32[2 * count + 1] into the string blob
+        blob     UTF-8 phrases, english/translated alternating, longest first
+    """
+    source = PHRASES_DIR / f"{lang_code}.json"
+    stat = source.stat()
+    with open(source, 'r', encoding='utf-8') as f:
+        try:
+            table = json.load(f, object_pairs_hook=_read_phrase_pairs)
+        except json.JSONDecodeError as e:
+            raise PhraseTableError(f"{lang_code}: invalid JSON ({e})") from e
+        except PhraseTableError as e:
+            raise PhraseTableError(f"{lang_code}: {e}") from e
+    validate_phrases(lang_code, table)
+
+    # Replacement order: longest English phrase first, stable by insertion
+    pairs = sorted(table.items(), key=lambda x: -len(x[0]))
+
+    blob = bytearray()
+    offsets = array('I', [0])
+    for en_text, translated in pairs:
+        for text in (en_text, translated):
+            blob += text.encode('utf-8')
+            offsets.append(len(blob))
+    if sys.byteorder != 'little':
+        offsets.byteswap()
+
+    PHRASES_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    target = PHRASES_CACHE_DIR / f"{lang_code}.bin"
+    tmp = target.with_suffix('.tmp')
+    body = offsets.tobytes() + blob
+    with open(tmp, 'wb') as f:
+        f.write(PHRASES_HEADER.pack(PHRASES_MAGIC, PHRASES_VERSION, stat.st_mtime_ns,
+                                    stat.st_size, len(pairs), zlib.crc32(body)))
+        f.write(body)
+    os.replace(tmp, target)
+    return pairs
+
+
+def _load_compiled(lang_code):
+    """Return pairs from the binary cache, or None if missing, stale or damaged"""
+    source = PHRASES_DIR / f"{lang_code}.json"
+    compiled = PHRASES_CACHE_DIR / f"{lang_code}.bin"
+    try:
+        data = compiled.read_bytes()
+        stat = source.stat()
+    except FileNotFoundError:
+        return None
+    if len(data) < PHRASES_HEADER.size:
+        return None
+
+    magic, version, mtime_ns, size, count, crc = PHRASES_HEADER.unpack_from(data)
+    if (magic, version, mtime_ns, size) != (PHRASES_MAGIC, PHRASES_VERSION,
+                                            stat.st_mtime_ns, stat.st_size):
+        return None
+
+    # A truncated or damaged file is treated like a stale one and recompiled
+    start = PHRASES_HEADER.size
+    end = start + (2 * count + 1) * 4
+    if len(data) < end or zlib.crc32(memoryview(data)[start:]) != crc:
+        return None
+    offsets = array('I')
+    offsets.frombytes(data[start:end])
+    if sys.byteorder != 'little':
+        offsets.byteswap()
+    if offsets[0] != 0 or len(data) != end + offsets[-1]:
+        return None
+    blob = memoryview(data)[end:]
+    try:
+        strings = []
+        for i in range(2 * count):
+            if offsets[i] > offsets[i + 1]:
+                return None
+            strings.append(str(blob[offsets[i]:offsets[i + 1]], 'utf-8'))
+    except UnicodeDecodeError:
+        return None
+    return list(zip(strings[0::2], strings[1::2]))
+
+
+def get_phrase_table(lang_code):
+    """Get (english, translated) pairs for a language, longest phrase first
+
+    Tables are loaded lazily, only for languages that are actually requested,
+    from the compiled cache when it is up to date with the JSON source.
+    """
+    if lang_code not in _phrase_tables:
+        if not (PHRASES_DIR / f"{lang_code}.json").exists():
+            _phrase_tables[lang_code] = []
         else:
-            return obj
-
-    if lang_code not in translations:
-        return en_data
+            pairs = _load_compiled(lang_code)
+            if pairs is None:
+                pairs = compile_phrase_table(lang_code)
+            _phrase_tables[lang_code] = pairs
+    return _phrase_tables[lang_code]
 
-    return translate_recursive(en_data, translations[lang_code])
 
+def get_translation(lang_code, en_data):
+    """Translate an English locale tree into the given language"""
+    return translate_structure(en_data, get_phrase_table(lang_code))
 
-def main():
-    """Main translation process"""
-    base_path = Path(__file__).parent.parent / 'i18n' / 'locales'
-
-    # Load English source
-    en_file = base_path / 'en' / 'common.json'
-    with open(en_file, 'r', encoding='utf-8') as f:
-        en_data = json.load(f)
 
-    print("🌍 Starting translation process...")
+def translate_namespace(base_path, namespace):
+    """Translate one English namespace file into every target language"""
+    en_file = base_path / SOURCE_LANG / f"{namespace}.json"
+    en_data = load_json(en_file)
     print(f"📖 Source: {en_file}\n")
 
-    # Target languages
-    languages = {
-        'de': 'Deutsch',
-        'sr': 'Српски',
-        'es': 'Español',
-        'fr': 'Français',
-        'it': 'Italiano',
-        'ru': 'Русский'
-    }
-
-    for lang_code, lang_name in languages.items():
+    for lang_code, lang_name in LANGUAGES.items():
         print(f"🔄 Translating to {lang_name} ({lang_code})...")
 
         # Get translation
@@ -370,13 +238,281 @@ def main():
         # Save to file
         lang_path = base_path / lang_code
         lang_path.mkdir(parents=True, exist_ok=True)
-        output_file = lang_path / 'common.json'
+        output_file = lang_path / f"{namespace}.json"
 
         save_json(output_file, translated)
         print(f"   ✅ Saved to {output_file}")
 
+
+# ---------------------------------------------------------------------------
+# Watch mode
+# ---------------------------------------------------------------------------
+
+def flatten(obj, prefix=()):
+    """Flatten nested dict into {('a', 'b', 'c'): value}"""
+    flat = {}
+    for key, value in obj.items():
+        path = prefix + (key,)
+        if isinstance(value, dict) and value:
+            flat.update(flatten(value, path))
+        else:
+            flat[path] = value
+    return flat
+
+
+_REMOVED = object()
+
+
+def _without_removed(value, path, removed):
+    """Drop removed key paths from a target-only subtree"""
+    if path in removed:
+        return _REMOVED
+    if isinstance(value, dict) and value:
+        kept = {}
+        for key, child in value.items():
+            child = _without_removed(child, path + (key,), removed)
+            if child is not _REMOVED:
+                kept[key] = child
+        return kept or _REMOVED
+    return value
+
+
+def merge_ordered(en_node, target_node, phrases, changed, removed, path=()):
+    """Rebuild a target tree in English key order
+
+    Keys in `changed` are re-translated, every other value is reused from
+    the target as is. Keys the target does not have stay missing, and
+    target-only keys are kept after the English ones unless they were just
+    removed from the English source.
+    """
+    if not isinstance(target_node, dict):
+        target_node = {}
+    merged = {}
+    for key, value in en_node.items():
+        key_path = path + (key,)
+        if isinstance(value, dict) and value:
+            child = merge_ordered(value, target_node.get(key), phrases, changed, removed, key_path)
+            if child:
+                merged[key] = child
+        elif key_path in changed:
+            merged[key] = translate_structure(value, phrases)
+        elif key in target_node:
+            merged[key] = target_node[key]
+    for key, value in target_node.items():
+        if key not in merged and key not in en_node:
+            value = _without_removed(value, path + (key,), removed)
+            if value is not _REMOVED:
+                merged[key] = value
+    return merged
+
+
+class Inotify:
+    """Minimal inotify(7) binding via ctypes (Linux only)"""
+
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    EVENT_HEADER = struct.Struct('iIII')
+
+    def __init__(self, directory):
+        libc_name = ctypes.util.find_library('c')
+        if not sys.platform.startswith('linux') or not libc_name:
+            raise OSError('inotify is not available on this platform')
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        mask = (self.IN_CLOSE_WRITE | self.IN_MOVED_FROM | self.IN_MOVED_TO
+                | self.IN_CREATE | self.IN_DELETE)
+        if libc.inotify_add_watch(self.fd, os.fsencode(directory), mask) < 0:
+            os.close(self.fd)
+            raise OSError(ctypes.get_errno(), f'inotify_add_watch failed for {directory}')
+
+    def read(self, timeout):
+        """Return names of files that changed, waiting at most `timeout` seconds"""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+        names = set()
+        offset = 0
+        while offset < len(data):
+            _, _, _, length = self.EVENT_HEADER.unpack_from(data, offset)
+            offset += self.EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0')
+            offset += length
+            if name:
+                names.add(os.fsdecode(name))
+        return names
+
+    def close(self):
+        os.close(self.fd)
+
+
+class Poller:
+    """mtime polling fallback for platforms without inotify"""
+
+    def __init__(self, directory, interval=0.05):
+        self.directory = Path(directory)
+        self.interval = interval
+        self.mtimes = self._scan()
+
+    def _scan(self):
+        mtimes = {}
+        for path in self.directory.glob('*.json'):
+            try:
+                mtimes[path.name] = path.stat().st_mtime_ns
+            except FileNotFoundError:
+                # Deleted between glob() and stat(), reported on the next scan
+                continue
+        return mtimes
+
+    def read(self, timeout):
+        """Return names of files that changed, waiting at most `timeout` seconds"""
+        time.sleep(min(timeout, self.interval) if timeout is not None else self.interval)
+        current = self._scan()
+        changed = {name for name, mtime in current.items() if self.mtimes.get(name) != mtime}
+        changed |= set(self.mtimes) - set(current)
+        self.mtimes = current
+        return changed
+
+    def close(self):
+        pass
+
+
+class LocaleWatcher:
+    """Keeps English sources in memory and re-translates only changed keys"""
+
+    def __init__(self, base_path):
+        self.base_path = base_path
+        self.source_dir = base_path / SOURCE_LANG
+        self.trees = {}
+        self.sources = {}
+        for en_file in sorted(self.source_dir.glob('*.json')):
+            self.trees[en_file.stem] = load_json(en_file)
+            self.sources[en_file.stem] = flatten(self.trees[en_file.stem])
+        # Warm the phrase tables so the first edit is as fast as the rest
+        for lang_code in LANGUAGES:
+            get_phrase_table(lang_code)
+
+    def update(self, namespace):
+        """Re-translate changed keys of one namespace; return written files"""
+        en_file = self.source_dir / f"{namespace}.json"
+        old = self.sources.get(namespace, {})
+        try:
+            tree = load_json(en_file)
+        except FileNotFoundError:
+            # Deleted or renamed away: never treat that as "all keys removed",
+            # the target files hold translations that cannot be regenerated
+            if namespace in self.sources:
+                print(f"   ⚠️  {en_file.name}: source missing, target locales left untouched")
+            return []
+        except json.JSONDecodeError as e:
+            print(f"   ⚠️  {en_file.name}: invalid JSON ({e}), skipped")
+            return []
+        new = flatten(tree)
+
+        changed = {path for path, value in new.items() if old.get(path) != value}
+        removed = {path for path in old if path not in new}
+        self.trees[namespace] = tree
+        self.sources[namespace] = new
+        if not changed and not removed:
+            return []
+
+        written = []
+        for lang_code in LANGUAGES:
+            output_file = self.base_path / lang_code / f"{namespace}.json"
+            try:
+                data = load_json(output_file) if output_file.exists() else {}
+            except json.JSONDecodeError as e:
+                print(f"   ⚠️  {lang_code}/{output_file.name}: invalid JSON ({e}), skipped")
+                continue
+            merged = merge_ordered(tree, data, get_phrase_table(lang_code), changed, removed)
+
+            # Compare serialized so a pure key reorder also counts as a change
+            if json.dumps(merged, ensure_ascii=False) != json.dumps(data, ensure_ascii=False):
+                output_file.parent.mkdir(parents=True, exist_ok=True)
+                save_json(output_file, merged)
+                written.append(output_file)
+
+        print(f"   🔄 {namespace}: {len(changed)} changed, {len(removed)} removed "
+              f"-> {len(written)} files")
+        return written
+
+    def run(self):
+        """Block and process filesystem events until interrupted"""
+        try:
+            events = Inotify(self.source_dir)
+            backend = 'inotify'
+        except OSError:
+            events = Poller(self.source_dir)
+            backend = 'polling'
+
+        print(f"👀 Watching {self.source_dir} ({backend}), Ctrl+C to stop")
+        try:
+            while True:
+                pending = events.read(None)
+                # Debounce: keep collecting until the burst goes quiet
+                while True:
+                    more = events.read(DEBOUNCE_SECONDS)
+                    if not more:
+                        break
+                    pending |= more
+
+                start = time.perf_counter()
+                written = []
+                for name in sorted(pending):
+                    if name.endswith('.json') and not name.startswith('.'):
+                        written += self.update(name[:-len('.json')])
+                if written:
+                    elapsed = (time.perf_counter() - start) * 1000
+                    print(f"   ✅ {len(written)} files updated in {elapsed:.1f} ms")
+        except KeyboardInterrupt:
+            print("\n👋 Stopped watching")
+        finally:
+            events.close()
+
+
+def main():
+    """Main translation process"""
+    parser = argparse.ArgumentParser(description='Translate i18n locale files from English')
+    parser.add_argument('--watch', action='store_true',
+                        help='Watch i18n/locales/en and re-translate changed keys')
+    parser.add_argument('--compile', action='store_true',
+                        help='Validate and compile scripts/phrases/*.json, then exit')
+    parser.add_argument('--locales', type=Path, default=LOCALES_DIR, help='Locales directory')
+    args = parser.parse_args()
+
+    base_path = args.locales
+
+    if args.compile:
+        failed = False
+        for source in sorted(PHRASES_DIR.glob('*.json')):
+            try:
+                pairs = compile_phrase_table(source.stem)
+                print(f"   ✅ {source.stem}: {len(pairs)} phrases")
+            except PhraseTableError as e:
+                print(f"   ❌ {e}")
+                failed = True
+        sys.exit(1 if failed else 0)
+
+    if args.watch:
+        LocaleWatcher(base_path).run()
+        return
+
+    print("🌍 Starting translation process...")
+
+    translate_namespace(base_path, 'common')
+
     print("\n✨ Translation completed successfully!")
-    print(f"📝 Translated to {len(languages)} languages")
+    print(f"📝 Translated to {len(LANGUAGES)} languages")
 
 
 if __name__ == '__main__':
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Translation memory for i18n locale files
+Builds en -> xx pairs from all aligned keys in i18n/locales and suggests
+translations for English keys that are still missing in a target locale.
+
+Lookups go through a character n-gram inverted index, so each new string
+only touches candidates that share at least one n-gram with it.
+
+Usage:
+    python3 scripts/translation-memory.py                 # print suggestions
+    python3 scripts/translation-memory.py --output tm.json
+    python3 scripts/translation-memory.py --apply                   # exact matches only
+    python3 scripts/translation-memory.py --apply --apply-score 0.9 # also near matches
+"""
+
+import argparse
+import heapq
+import json
+import time
+from collections import defaultdict
+from pathlib import Path
+
+LOCALES_DIR = Path(__file__).parent.parent / 'i18n' / 'locales'
+SOURCE_LANG = 'en'
+TARGET_LANGS = ['de', 'sr', 'es', 'fr', 'it', 'ru']
+NGRAM_SIZE = 3
+
+
+def load_json(filepath):
+    """Load JSON file"""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_json(filepath, data):
+    """Save JSON file with proper formatting"""
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+
+
+def flatten(obj, prefix=''):
+    """Flatten nested dict into {'a.b.c': value} for string leaves"""
+    flat = {}
+    for key, value in obj.items():
+        path = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            flat.update(flatten(value, path))
+        elif isinstance(value, str):
+            flat[path] = value
+    return flat
+
+
+def set_path(obj, path, value):
+    """Set a dotted key path inside a nested dict"""
+    parts = path.split('.')
+    for part in parts[:-1]:
+        obj = obj.setdefault(part, {})
+    obj[parts[-1]] = value
+
+
+def ngrams(text, n=NGRAM_SIZE):
+    """Return the set of character n-grams of a normalized string"""
+    normalized = f" {' '.join(text.lower().split())} "
+    if len(normalized) <= n:
+        return {normalized}
+    return {normalized[i:i + n] for i in range(len(normalized) - n + 1)}
+
+
+class TranslationMemory:
+    """English source strings with their known translations, indexed by n-gram"""
+
+    def __init__(self):
+        self.sources = []       # entry id -> English text
+        self.gram_counts = []   # entry id -> number of distinct n-grams
+        self.translations = []  # entry id -> {lang: translated text}
+        self.ids = {}           # English text -> entry id
+        self.index = defaultdict(list)  # n-gram -> [entry id, ...]
+
+    def __len__(self):
+        return len(self.sources)
+
+    def add(self, source, lang, translated):
+        """Add an aligned source/translation pair"""
+        entry_id = self.ids.get(source)
+        if entry_id is None:
+            entry_id = len(self.sources)
+            grams = ngrams(source)
+            self.ids[source] = entry_id
+            self.sources.append(source)
+            self.gram_counts.append(len(grams))
+            self.translations.append({})
+            for gram in grams:
+                self.index[gram].append(entry_id)
+        self.translations[entry_id].setdefault(lang, translated)
+
+    def exact(self, text, lang):
+        """Return the translation of exactly this English source, or None"""
+        entry_id = self.ids.get(text)
+        if entry_id is None:
+            return None
+        return self.translations[entry_id].get(lang)
+
+    def search(self, text, lang, limit=3, min_score=0.5):
+        """Return up to `limit` (score, source, translation) tuples for a language
+
+        Score is the Dice coefficient over character n-grams (1.0 = identical
+        after lowercasing), ties go to the source that matches `text` exactly.
+        """
+        grams = ngrams(text)
+        shared = defaultdict(int)
+        for gram in grams:
+            for entry_id in self.index.get(gram, ()):
+                shared[entry_id] += 1
+
+        scored = []
+        for entry_id, count in shared.items():
+            translated = self.translations[entry_id].get(lang)
+            if translated is None:
+                continue
+            score = 2 * count / (len(grams) + self.gram_counts[entry_id])
+            if score >= min_score:
+                scored.append((score, self.sources[entry_id], translated))
+
+        return heapq.nlargest(limit, scored, key=lambda item: (item[0], item[1] == text))
+
+
+def load_sources(base_path):
+    """Return {namespace: flattened English strings}, parsed once per run"""
+    return {
+        en_file.stem: flatten(load_json(en_file))
+        for en_file in sorted((base_path / SOURCE_LANG).glob('*.json'))
+    }
+
+
+def build_memory(base_path, sources):
+    """Build a translation memory from all aligned en -> xx keys"""
+    memory = TranslationMemory()
+    for namespace, source in sources.items():
+        for lang in TARGET_LANGS:
+            target_file = base_path / lang / f"{namespace}.json"
+            if not target_file.exists():
+                continue
+            target = flatten(load_json(target_file))
+            for key, en_text in source.items():
+                translated = target.get(key)
+                # Identical values are usually untranslated copies, not memory
+                if translated and translated != en_text:
+                    memory.add(en_text, lang, translated)
+    return memory
+
+
+def find_missing(base_path, source, namespace, lang):
+    """Return {key: English text} for keys not yet present in a locale"""
+    target_file = base_path / lang / f"{namespace}.json"
+    target = flatten(load_json(target_file)) if target_file.exists() else {}
+    return {key: text for key, text in source.items() if key not in target}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Suggest translations for new i18n keys')
+    parser.add_argument('--locales', type=Path, default=LOCALES_DIR, help='Locales directory')
+    parser.add_argument('--limit', type=int, default=3, help='Suggestions per key and locale')
+    parser.add_argument('--min-score', type=float, default=0.5, help='Minimum similarity (0-1)')
+    parser.add_argument('--output', type=Path, help='Write suggestions as JSON')
+    parser.add_argument('--apply', action='store_true',
+                        help='Pre-fill missing keys with the best suggestion')
+    parser.add_argument('--apply-score', type=float, default=1.0,
+                        help='Minimum similarity for --apply (0-1, default: exact source match)')
+    args = parser.parse_args()
+
+    base_path = args.locales
+    sources = load_sources(base_path)
+
+    print("🧠 Building translation memory...")
+    start = time.perf_counter()
+    memory = build_memory(base_path, sources)
+    print(f"   ✓ {len(memory)} source strings, {len(memory.index)} n-grams "
+          f"({(time.perf_counter() - start) * 1000:.1f} ms)")
+
+    report = {}
+    total_missing = 0
+    total_suggested = 0
+    total_applied = 0
+    start = time.perf_counter()
+
+    for lang in TARGET_LANGS:
+        report[lang] = {}
+        for namespace, source in sources.items():
+            missing = find_missing(base_path, source, namespace, lang)
+            if not missing:
+                continue
+
+            suggestions = {}
+            for key, text in missing.items():
+                matches = memory.search(text, lang, args.limit, args.min_score)
+                if matches:
+                    suggestions[key] = [
+                        {'score': round(score, 3), 'source': source, 'translation': translated}
+                        for score, source, translated in matches
+                    ]
+
+            total_missing += len(missing)
+            total_suggested += len(suggestions)
+            report[lang][namespace] = {'missing': len(missing), 'suggestions': suggestions}
+
+            # Score 1.0 only means identical n-gram sets ("Delete" vs "delete"),
+            # so exact sources are looked up directly before any fuzzy match
+            prefill = {}
+            for key, text in missing.items():
+                translated = memory.exact(text, lang)
+                if translated is not None:
+                    prefill[key] = {'score': 1.0, 'source': text, 'translation': translated}
+                elif args.apply_score < 1.0 and key in suggestions:
+                    best = suggestions[key][0]
+                    if best['score'] >= args.apply_score:
+                        prefill[key] = best
+            if args.apply and prefill:
+                target_file = base_path / lang / f"{namespace}.json"
+                data = load_json(target_file) if target_file.exists() else {}
+                for key, best in prefill.items():
+                    set_path(data, key, best['translation'])
+                save_json(target_file, data)
+                total_applied += len(prefill)
+                # Record which English string each pre-filled value came from
+                report[lang][namespace]['applied'] = {
+                    key: {'source': best['source'], 'score': best['score']}
+                    for key, best in prefill.items()
+                }
+
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"\n🔎 {total_missing} missing keys, {total_suggested} with suggestions "
+          f"({elapsed:.1f} ms)")
+
+    for lang, namespaces_report in report.items():
+        for namespace, entry in namespaces_report.items():
+            print(f"\n🌍 {lang}/{namespace}.json - {entry['missing']} missing, "
+                  f"{len(entry['suggestions'])} suggested")
+            for key, ranked in list(entry['suggestions'].items())[:5]:
+                best = ranked[0]
+                print(f"   {key}: {best['translation']!r} ({best['score']:.2f} ~ {best['source']!r})")
+
+    if args.output:
+        save_json(args.output, report)
+        print(f"\n💾 Saved: {args.output}")
+
+    if args.apply:
+        mode = 'exact matches' if args.apply_score >= 1.0 else f"score >= {args.apply_score}"
+        print(f"\n✅ {total_applied} missing keys pre-filled ({mode})")
+        if total_applied and not args.output:
+            print("   ℹ️  Use --output to keep the matched source of each pre-filled key for review")
+
+
+if __name__ == '__main__':
+    main()